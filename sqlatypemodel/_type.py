@@ -1,8 +1,8 @@
-import json
-from typing import Callable, Union
+from typing import Any, Callable, Optional, Union
 
 import sqlalchemy as sa
-from .protocols import ModelProto, PydanticModelProto
+from . import serializer
+from .protocols import ModelProto, PydanticModelProto, PydanticV2ModelProto
 from sqlalchemy.engine.default import DefaultDialect
 
 
@@ -16,13 +16,31 @@ class ModelType(sa.types.TypeDecorator):
                  model: ModelProto,
                  json_encoder: Union[Callable[[ModelProto],
                                               str], str] = 'json',
+                 json_loads: Optional[Callable[[str], Any]] = None,
                  *args, **kwargs):
         super(ModelType, self).__init__(*args, **kwargs)
         self.model = model
-        if isinstance(model, PydanticModelProto):
+        # kept under the argument names, SQLAlchemy builds the
+        # statement cache key from them
+        self.json_encoder = json_encoder
+        self.json_loads = json_loads
+        # v2 first: v2 models may still declare a class-based Config,
+        # which has no json_loads
+        is_pydantic_v2 = isinstance(model, PydanticV2ModelProto)
+        self.validate_json: Optional[Callable[[str], ModelProto]] = None
+        if json_loads is not None:
+            self.loads = json_loads
+        elif is_pydantic_v2:
+            self.loads = serializer.loads
+            # parse and validate in a single pass inside pydantic-core
+            self.validate_json = model.model_validate_json
+        elif isinstance(model, PydanticModelProto):
             self.loads = model.Config.json_loads
         else:
-            self.loads = json.loads
+            self.loads = serializer.loads
+        if json_encoder == 'json' and is_pydantic_v2:
+            # pydantic v2 deprecates .json(), warning on every row
+            json_encoder = 'model_dump_json'
         if isinstance(json_encoder, str):
             self.encoder: Callable[[ModelProto],
                                    str] = getattr(self.model,
@@ -34,6 +52,8 @@ class ModelType(sa.types.TypeDecorator):
         return self.encoder(value)
 
     def process_result_value(self, value: str, dialect: DefaultDialect):
+        if self.validate_json is not None:
+            return self.validate_json(value)
         return self.model(
             **self.loads(value)
         )
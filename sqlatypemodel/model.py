@@ -2,30 +2,42 @@
 Simple model implementation, if you do not want use pydantic
 """
 
-import json
-from typing import Any, ClassVar, Dict, Set
+from typing import Any, Callable, ClassVar, Dict, Set
 from typing_extensions import dataclass_transform
-from .protocols import JsonableModelProto
+from . import serializer
+from .protocols import JsonableModelProto, PydanticV2ModelProto
 
-
-class Encoder(json.JSONEncoder):
-    def encode(self, o: Any) -> str:
-        if isinstance(o, JsonableModelProto):
-            return o.json()
-        return super().encode(o)
+# documents with dynamic keys must not grow the ignore() memo forever
+IGNORE_CACHE_SIZE = 4096
 
 
 @dataclass_transform()
 class Model(JsonableModelProto):
     ignore_upper: ClassVar[bool] = True
+    # set to serializer.orjson_dumps to encode with orjson
+    json_dumps: ClassVar[Callable[..., str]] = serializer.dumps
+    # per-class memo of ignore() results, names repeat on every row
+    _ignored: ClassVar[Dict[str, bool]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._ignored = {}
 
     def __init__(self, **kwargs: Any):
         self.__fields__: Set[str] = set()
+        add_field = self.__fields__.add
+        cache = self._ignored
+        ignore = self.ignore
         for k, v in kwargs.items():
             setattr(self, k, v)
-            if self.ignore(k):
+            ignored = cache.get(k)
+            if ignored is None:
+                ignored = ignore(k)
+                if len(cache) < IGNORE_CACHE_SIZE:
+                    cache[k] = ignored
+            if ignored:
                 continue
-            self.__fields__.add(k)
+            add_field(k)
 
     @classmethod
     def ignore(cls, name: str) -> bool:
@@ -39,10 +51,23 @@ class Model(JsonableModelProto):
         )
 
     def json(self) -> str:
-        return json.dumps(
+        return type(self).json_dumps(
             self.dict(),
-            cls=Encoder
+            default=_default
         )
 
     def dict(self) -> Dict[str, Any]:
         return {k: getattr(self, k) for k in self.__fields__}
+
+
+def _default(o: Any) -> Any:
+    # called by the encoder only for values it cannot serialize itself
+    if isinstance(o, Model):
+        return o.dict()
+    if isinstance(o, PydanticV2ModelProto):
+        return o.model_dump(mode='json')
+    if isinstance(o, JsonableModelProto):
+        return serializer.loads(o.json())
+    raise TypeError(
+        f'Object of type {o.__class__.__name__} is not JSON serializable'
+    )
@@ -19,3 +19,16 @@ class PydanticConfigProto(Protocol):
 @runtime_checkable
 class PydanticModelProto(JsonableModelProto, Protocol):
     Config: Type[PydanticConfigProto]
+
+
+@runtime_checkable
+class PydanticV2ModelProto(ModelProto, Protocol):
+    def model_dump(self, *args: Any, **kwargs: Any) -> Any:
+        ...
+
+    def model_dump_json(self, *args: Any, **kwargs: Any) -> str:
+        ...
+
+    @classmethod
+    def model_validate_json(cls, *args: Any, **kwargs: Any) -> Any:
+        ...
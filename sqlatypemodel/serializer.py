@@ -0,0 +1,53 @@
+"""
+JSON helpers
+
+stdlib json is the default, orjson is opt-in via orjson_loads and
+orjson_dumps: it reads integers beyond 64 bits as floats (losing
+precision), writes NaN/Infinity as null and encodes datetime, UUID,
+Enum and dataclass values natively
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+loads: Callable[[Union[str, bytes]], Any] = json.loads
+dumps: Callable[..., str] = json.dumps
+
+
+if orjson is not None:
+    # integers beyond 64 bits, lone surrogates
+    _STDLIB_ENCODABLE_ERRORS = (
+        'Integer exceeds 64-bit range',
+        'str is not valid UTF-8',
+    )
+
+    def orjson_loads(value: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity, as written by stdlib json
+            return json.loads(value)
+
+    def orjson_dumps(obj: Any,
+                     default: Optional[Callable[[Any], Any]] = None) -> str:
+        try:
+            # non str keys are stringified, like stdlib json does
+            return orjson.dumps(
+                obj,
+                default=default,
+                option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError as e:
+            # only values stdlib json can still encode are retried,
+            # errors from default (chained by newer orjson) are not
+            if (e.__cause__ is not None
+                    or not str(e).startswith(_STDLIB_ENCODABLE_ERRORS)):
+                raise
+            return json.dumps(obj, default=default)
@@ -0,0 +1,69 @@
+import json
+import math
+import warnings
+
+import pytest
+
+from sqlatypemodel import Model, serializer
+from sqlatypemodel.model import IGNORE_CACHE_SIZE
+
+
+class _AnyNan:
+    def __eq__(self, other):
+        return isinstance(other, float) and math.isnan(other)
+
+
+ANY_NAN = _AnyNan()
+
+
+def test_ignore_cache_is_bounded():
+    class Dynamic(Model):
+        pass
+
+    for i in range(IGNORE_CACHE_SIZE + 100):
+        Dynamic(**{f'key_{i}': i})
+    assert len(Dynamic._ignored) == IGNORE_CACHE_SIZE
+
+    # names past the limit are still classified, just not memoized
+    model = Dynamic(extra=1, _private=2, UPPER=3)
+    assert model.__fields__ == {'extra'}
+    assert 'extra' not in Dynamic._ignored
+
+
+def test_json_is_stdlib_by_default():
+    model = Model(big=2 ** 70, nan=float('nan'), keys={1: 2})
+    assert json.loads(model.json()) == {
+        'big': 2 ** 70, 'nan': ANY_NAN, 'keys': {'1': 2}
+    }
+
+
+@pytest.mark.skipif(not serializer.HAS_ORJSON, reason='orjson not installed')
+def test_json_orjson_opt_in():
+    class Fast(Model):
+        json_dumps = serializer.orjson_dumps
+
+    model = Fast(big=2 ** 70, keys={1: 2}, text='\ud800')
+    assert json.loads(model.json()) == json.loads(
+        json.dumps(model.dict())
+    )
+    assert Fast(nan=float('nan')).json() == '{"nan":null}'
+
+
+def test_json_nested_models():
+    pydantic = pytest.importorskip('pydantic', minversion='2')
+
+    class Message(pydantic.BaseModel):
+        text: str
+        tags: set
+
+    class Inner(Model):
+        pass
+
+    model = Model(inner=Inner(a=1), message=Message(text='hi', tags={1}))
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        encoded = model.json()
+    assert json.loads(encoded) == {
+        'inner': {'a': 1},
+        'message': {'text': 'hi', 'tags': [1]},
+    }
@@ -0,0 +1,102 @@
+import json
+
+import sqlalchemy as sa
+import pytest
+from sqlalchemy.orm import Session, declarative_base
+
+from sqlatypemodel import Model, ModelType, serializer
+
+BIG_INT = 2 ** 70
+
+
+class Simple(Model):
+    pass
+
+
+def stdlib_encoder(value: Simple) -> str:
+    # rows as written by stdlib json, independent of Model.json
+    return json.dumps(value.dict())
+
+
+def roundtrip(column_type: ModelType, value):
+    Base = declarative_base()
+
+    class Row(Base):
+        __tablename__ = 'rows'
+        id = sa.Column(sa.Integer, primary_key=True)
+        data = sa.Column(column_type)
+
+    engine = sa.create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Row(data=value))
+        session.commit()
+    with Session(engine) as session:
+        return session.query(Row).one().data
+
+
+@pytest.mark.parametrize('value', [BIG_INT, float('inf')])
+def test_default_loads_is_stdlib(value):
+    assert ModelType(Simple).loads is serializer.loads
+    loaded = roundtrip(ModelType(Simple, stdlib_encoder), Simple(x=value))
+    assert loaded.x == value
+    assert type(loaded.x) is type(value)
+
+
+def test_default_loads_reads_nan():
+    loaded = roundtrip(
+        ModelType(Simple, stdlib_encoder), Simple(x=float('nan'))
+    )
+    assert loaded.x != loaded.x
+
+
+@pytest.mark.skipif(not serializer.HAS_ORJSON, reason='orjson not installed')
+def test_orjson_loads_opt_in():
+    column_type = ModelType(
+        Simple, stdlib_encoder, json_loads=serializer.orjson_loads
+    )
+    assert column_type.loads is serializer.orjson_loads
+    # stdlib json writes NaN, orjson falls back to stdlib to read it
+    loaded = roundtrip(column_type, Simple(x=float('nan'), y=1))
+    assert loaded.x != loaded.x
+    assert loaded.y == 1
+    # documented: orjson reads integers beyond 64 bits as floats
+    loaded = roundtrip(column_type, Simple(x=BIG_INT))
+    assert loaded.x == float(BIG_INT)
+
+
+def test_pydantic_v2_model_with_class_config():
+    pydantic = pytest.importorskip('pydantic', minversion='2')
+
+    # class-based Config is deprecated, but still accepted by pydantic v2
+    with pytest.warns(DeprecationWarning):
+        class Message(pydantic.BaseModel):
+            text: str
+
+            class Config:
+                frozen = True
+
+    column_type = ModelType(Message)
+    assert column_type.validate_json == Message.model_validate_json
+    assert column_type.encoder is Message.model_dump_json
+    loaded = roundtrip(column_type, Message(text='hello'))
+    assert loaded == Message(text='hello')
+
+
+def test_default_encoder_roundtrip():
+    loaded = roundtrip(
+        ModelType(Simple),
+        Simple(big=BIG_INT, nan=float('nan'), keys={1: 2})
+    )
+    assert loaded.big == BIG_INT
+    assert loaded.nan != loaded.nan
+    assert loaded.keys == {'1': 2}
+
+
+def test_cache_key_includes_json_arguments():
+    def cache_key(*args, **kwargs):
+        return ModelType(Simple, *args, **kwargs)._static_cache_key
+
+    assert cache_key() == cache_key()
+    assert cache_key() != cache_key(json_loads=json.loads)
+    assert cache_key() != cache_key(stdlib_encoder)